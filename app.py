@@ -1,19 +1,33 @@
 import os
 import re
 import io
+import csv
 import json
+import hashlib
 import time
+import mimetypes
+import posixpath
 import zipfile
 import sqlite3
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import dataclasses
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
-from urllib.parse import urlparse, urljoin, parse_qs
+from functools import lru_cache
+from itertools import zip_longest
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Tuple, Iterator, Union, Callable, Sequence
+from urllib.parse import urlparse, urlunparse, urljoin, parse_qs, unquote, ParseResult
 
 import pandas as pd
 import requests
 import streamlit as st
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Optional dotenv
 try:
@@ -22,6 +36,47 @@ try:
 except Exception:
     pass
 
+# Fast HTML parser (optional - Lexbor backend when available, else Modest, else BeautifulSoup + lxml)
+try:
+    try:
+        from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    except ImportError:
+        from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Fast JSON encoder/decoder (optional - falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# PDF export (optional)
+try:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    REPORTLAB_AVAILABLE = True
+except ImportError:
+    REPORTLAB_AVAILABLE = False
+
+# Excel writer (optional - xlsxwriter is much faster than openpyxl for exports)
+try:
+    import xlsxwriter
+    XLSX_ENGINE = "xlsxwriter"
+except ImportError:
+    XLSX_ENGINE = "openpyxl"
+
+# HTTP cache (optional - crawled pages are re-used across reruns when installed)
+try:
+    import requests_cache
+    HTTP_CACHE_AVAILABLE = True
+except ImportError:
+    HTTP_CACHE_AVAILABLE = False
+
 # BBS API import (optional - only needed for BBS platform)
 try:
     from bbs_api import backfill_all_years, search_keywords
@@ -154,6 +209,9 @@ st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
 # Helpers: state + logging
 # =========================
 def init_state():
+    # All keys are set together, so one membership test covers every rerun after the first.
+    if "history" in st.session_state:
+        return
     st.session_state.setdefault("history", [])
     st.session_state.setdefault("search_df", pd.DataFrame())
     st.session_state.setdefault("files_df", pd.DataFrame())
@@ -177,11 +235,12 @@ def stop_requested() -> bool:
     return bool(st.session_state.get("stop_flag", False))
 
 
-@dataclass
+@dataclass(frozen=True)
 class Settings:
     delay_seconds: float = 1.5
     timeout_seconds: int = 20
     max_pages_per_site: int = 10
+    workers: int = 8
     user_agent: str = "ScrapBeePro/1.0 (+https://example.local)"
 
 
@@ -202,38 +261,165 @@ SERPER_API_KEY = get_secret("SERPER_API_KEY", "")
 YOUTUBE_API_KEY = get_secret("YOUTUBE_API_KEY", "")
 
 
+# =========================
+# HTTP session (shared across reruns)
+# =========================
+def _configure_session(s: requests.Session, retry: Optional[Retry] = None) -> requests.Session:
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=retry or Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers.update({"User-Agent": Settings.user_agent})
+    return s
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """One keep-alive session per server process, so repeated calls reuse TCP/TLS connections."""
+    return _configure_session(requests.Session())
+
+
+MAX_HTML_BYTES = 4 * 1024 * 1024
+
+
+def _is_small_html(r: requests.Response) -> bool:
+    """
+    Page-cache filter. requests_cache reads the whole body of anything it stores,
+    so only HTML with a declared Content-Length under MAX_HTML_BYTES qualifies;
+    everything else stays a plain streamed response.
+    """
+    if "text/html" not in (r.headers.get("content-type") or "").lower():
+        return False
+    try:
+        return 0 <= int(r.headers.get("content-length") or -1) <= MAX_HTML_BYTES
+    except ValueError:
+        return False
+
+
+@st.cache_resource
+def get_page_session() -> requests.Session:
+    """
+    Session for crawled HTML pages. Backed by an on-disk HTTP cache when
+    requests_cache is installed, so reruns and re-crawls skip the network;
+    only small HTML responses are cached (see _is_small_html).
+    File downloads and API calls keep using get_session().
+    """
+    if not HTTP_CACHE_AVAILABLE:
+        return get_session()
+    s = requests_cache.CachedSession(
+        cache_name=os.path.join(tempfile.gettempdir(), "scrapbee_http"),
+        backend="sqlite",
+        expire_after=3600,
+        allowable_codes=(200,),
+        filter_fn=_is_small_html,
+        stale_if_error=True,
+    )
+    return _configure_session(s)
+
+
+@st.cache_resource
+def get_search_session() -> requests.Session:
+    """
+    Session for the Serper API. Search POSTs are safe to repeat, so they get
+    a longer retry budget (honouring Retry-After) to ride out 429s and 5xx.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,
+    )
+    return _configure_session(requests.Session(), retry)
+
+
+def response_json(r: requests.Response) -> Any:
+    """JSON body of an API response; orjson decodes the raw bytes directly when installed."""
+    return orjson.loads(r.content) if ORJSON_AVAILABLE else r.json()
+
+
+class _HostLimiter:
+    """Spaces requests to the same host by `delay` seconds; different hosts never wait on each other."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._next_allowed: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, host: str):
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next_allowed.get(host, 0.0))
+            self._next_allowed[host] = at + self.delay
+        if at > now:
+            time.sleep(at - now)
+
+
+_EMPTY_SLOT = object()
+
+
+def interleave_by_host(items: Sequence[Any], key: Callable[[Any], str] = lambda u: u) -> List[Any]:
+    """
+    Round-robin `items` across the hosts of their URLs (`key(item)`), so a pool's
+    first N workers hit N different hosts instead of all queueing on one
+    host's limiter while other hosts sit idle. Order within a host is kept.
+    """
+    by_host: Dict[str, List[Any]] = {}
+    for item in items:
+        by_host.setdefault(_parse(key(item)).netloc.lower(), []).append(item)
+    if len(by_host) < 2:
+        return list(items)
+    slices = zip_longest(*by_host.values(), fillvalue=_EMPTY_SLOT)
+    return [item for group in slices for item in group if item is not _EMPTY_SLOT]
+
+
 # =========================
 # Serper Search
 # =========================
-def serper_search(query: str, num_results: int, timeout: int) -> pd.DataFrame:
-    if not SERPER_API_KEY:
+SEARCH_COLUMNS = ["Select", "Title", "URL", "Snippet"]
+
+SERPER_URL = "https://google.serper.dev/search"
+
+# Process-wide client-side cap (~8 req/s) so concurrent sessions don't trip Serper's rate limit.
+_SERPER_LIMITER = _HostLimiter(1 / 8)
+
+
+@lru_cache(maxsize=8)
+def _serper_headers(api_key: str) -> Dict[str, str]:
+    """Built once per key; requests only reads it, so sharing across calls and threads is safe."""
+    return {"X-API-KEY": api_key, "Content-Type": "application/json"}
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def serper_search(query: str, num_results: int, timeout: int, api_key: str) -> pd.DataFrame:
+    """Cached per (query, num_results, timeout, api_key) so reruns don't re-hit the API."""
+    if not api_key:
         raise RuntimeError("SERPER_API_KEY is missing. Add it to .streamlit/secrets.toml or environment variables.")
 
-    url = "https://google.serper.dev/search"
-    headers = {
-        "X-API-KEY": SERPER_API_KEY,
-        "Content-Type": "application/json"
-    }
     payload = {"q": query, "num": min(max(num_results, 1), 100)}
-    r = requests.post(url, headers=headers, json=payload, timeout=timeout)
+    body = orjson.dumps(payload) if ORJSON_AVAILABLE else json.dumps(payload).encode("utf-8")
+    _SERPER_LIMITER.acquire("google.serper.dev")
+    r = get_search_session().post(SERPER_URL, headers=_serper_headers(api_key), data=body, timeout=timeout)
     r.raise_for_status()
-    data = r.json()
+    data = response_json(r)
 
-    rows = []
+    # Keyed on URL so duplicate organic hits are dropped on insertion; linkless
+    # hits get a positional key each so they aren't collapsed into one row.
+    rows: Dict[Any, Dict[str, Any]] = {}
     for item in data.get("organic", []) or []:
-        rows.append({
+        link = item.get("link") or ""
+        rows.setdefault(link or len(rows), {
             "Select": False,
-            "Title": item.get("title", ""),
-            "URL": item.get("link", ""),
-            "Snippet": item.get("snippet", "")
+            "Title": item.get("title") or "",
+            "URL": link,
+            "Snippet": item.get("snippet") or ""
         })
 
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df["Title"] = df["Title"].fillna("")
-        df["URL"] = df["URL"].fillna("")
-        df["Snippet"] = df["Snippet"].fillna("")
-    return df
+    # Values are already guaranteed strings, so no fillna passes are needed.
+    return pd.DataFrame.from_records(list(rows.values()), columns=SEARCH_COLUMNS)
 
 
 # =========================
@@ -246,133 +432,495 @@ DEFAULT_FILE_EXTS = [
     ".json", ".xml", ".zip", ".rar", ".7z"
 ]
 
+# One anchored alternation built from DEFAULT_FILE_EXTS: a single C-level suffix match per link.
+_EXT_RE = re.compile(
+    r"(?:%s)\Z" % "|".join(re.escape(e) for e in sorted(DEFAULT_FILE_EXTS, key=len, reverse=True))
+)
+
+FILE_COLUMNS = ["Select", "File", "Type", "URL", "Source"]
+
+_CD_FILENAME_RE = re.compile(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)"?', re.IGNORECASE)
+_SKIP_HREF_RE = re.compile(r"#|(?:mailto|javascript|tel|sms|data):", re.IGNORECASE)
+# Download-endpoint hints as whole path segments / query tokens ("/download", "?dlm_download=",
+# "/file/12", "format=csv"), so "profile", "filter" or "/files/" listings are not probed.
+_HEAD_HINT_RE = re.compile(
+    r"(?:^|[/?&=])(?:[\w-]*download[\w-]*|attachments?(?:_id)?|file|getfile|export|csv|xlsx?)(?=$|[/?&=#.])",
+    re.IGNORECASE,
+)
+
+@lru_cache(maxsize=100_000)
+def _parse(u: str):
+    """urlparse with memoization; crawled pages repeat the same hrefs a lot."""
+    return urlparse(u)
+
+
+_MULTI_SLASH_RE = re.compile(r"/{2,}")
+_TRACKING_PARAM_RE = re.compile(r"(?:utm_[^=&]*|fbclid|gclid|msclkid|mc_cid|mc_eid)(?:=|\Z)", re.IGNORECASE)
+_TRACKING_HINT_RE = re.compile(r"utm_|fbclid|gclid|msclkid|mc_cid|mc_eid", re.IGNORECASE)
+
+
+@lru_cache(maxsize=100_000)
+def _canonicalize(u: str) -> str:
+    """
+    Crawl key for a URL: lowercase scheme/host, no fragment, no default port,
+    repeated slashes and dot segments in the path resolved, tracking parameters (utm_*, fbclid, ...)
+    dropped. Equivalent links are fetched and probed once.
+    """
+    try:
+        p = _parse(u)
+        scheme = p.scheme.lower()
+        host = (p.hostname or "").lower()
+        if ":" in host:
+            # hostname strips the brackets off IPv6 literals; the URL needs them.
+            host = f"[{host}]"
+        port = p.port
+        if port is None or (scheme, port) in (("http", 80), ("https", 443)):
+            netloc = host
+        else:
+            netloc = f"{host}:{port}"
+        userinfo = p.netloc.rpartition("@")[0]
+        if userinfo:
+            netloc = f"{userinfo}@{netloc}"
+        path = _MULTI_SLASH_RE.sub("/", p.path) or "/"
+        if "/." in path:
+            # Resolve ./ and ../ segments (RFC 3986 5.2.4), keeping a trailing slash.
+            trailing = path.endswith(("/", "/.", "/.."))
+            path = posixpath.normpath(path)
+            if trailing and path != "/":
+                path += "/"
+        query = p.query
+        if query and _TRACKING_HINT_RE.search(query):
+            query = "&".join(kv for kv in query.split("&") if not _TRACKING_PARAM_RE.match(kv))
+        return urlunparse((scheme, netloc, path, p.params, query, ""))
+    except Exception:
+        return u
+
+
+@lru_cache(maxsize=4096)
 def is_valid_url(u: str) -> bool:
     try:
-        p = urlparse(u.strip())
+        p = _parse(u.strip())
         return p.scheme in ("http", "https") and bool(p.netloc)
     except Exception:
         return False
 
 
+_HTML_ACCEPT = {"Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.1"}
+
+
 def fetch_html(url: str, settings: Settings) -> Optional[str]:
+    """
+    Fetch an HTML page, reading at most MAX_HTML_BYTES of the body. The request
+    is streamed and the page cache only stores small HTML, so non-HTML and
+    oversized responses are dropped after the headers arrive.
+    """
     try:
-        headers = {"User-Agent": settings.user_agent}
-        r = requests.get(url, headers=headers, timeout=settings.timeout_seconds)
-        if r.status_code >= 400:
-            return None
-        ct = (r.headers.get("content-type") or "").lower()
-        if "text/html" not in ct:
-            return None
-        return r.text
+        with get_page_session().get(url, timeout=settings.timeout_seconds, stream=True, headers=_HTML_ACCEPT) as r:
+            if r.status_code >= 400:
+                return None
+            ct = (r.headers.get("content-type") or "").lower()
+            if "text/html" not in ct:
+                return None
+            body = r.raw.read(MAX_HTML_BYTES, decode_content=True)
+            return body.decode(r.encoding or "utf-8", errors="replace")
     except Exception:
         return None
 
 
+@lru_cache(maxsize=65536)
 def normalize_ext(url: str) -> str:
-    path = urlparse(url).path.lower()
-    for ext in DEFAULT_FILE_EXTS:
-        if path.endswith(ext):
-            return ext
-    return ""
+    m = _EXT_RE.search(_parse(url).path.lower())
+    return m.group(0) if m else ""
 
 
-def discover_files_from_sites(
-    sites: List[str],
-    exts: List[str],
-    settings: Settings
-) -> pd.DataFrame:
-    exts = [e.lower().strip() for e in exts]
-    found: List[Dict[str, Any]] = []
+_ANCHORS_ONLY = SoupStrainer("a", href=True)
 
-    for site in sites:
-        if stop_requested():
-            log("WARN", "Stopped by user.")
-            break
 
-        if not is_valid_url(site):
-            log("WARN", f"Skipping invalid site URL: {site}")
-            continue
+def extract_hrefs(html: str) -> List[str]:
+    """All non-empty <a href> values of a page, using the fastest parser available."""
+    if SELECTOLAX_AVAILABLE:
+        hrefs = (a.attributes.get("href") or "" for a in HTMLParser(html).css("a[href]"))
+    else:
+        soup = BeautifulSoup(html, "lxml", parse_only=_ANCHORS_ONLY)
+        hrefs = (a.get("href", "") for a in soup.find_all("a", href=True))
+    return [h.strip() for h in hrefs if h and h.strip()]
+
+
+def extract_page_meta(html: str) -> Tuple[str, str, str]:
+    """(title, first h1, meta description) of a page; "N/A" where absent."""
+    if SELECTOLAX_AVAILABLE:
+        tree = HTMLParser(html)
+        t = tree.css_first("title")
+        h = tree.css_first("h1")
+        m = tree.css_first('meta[name="description"]')
+        title = (t.text().strip() if t else "") or "N/A"
+        h1 = h.text(strip=True) if h else "N/A"
+        meta_desc = (m.attributes.get("content") or "").strip() if m else "N/A"
+        return title, h1, meta_desc
+
+    soup = BeautifulSoup(html, "lxml")
+    title = (soup.title.text.strip() if soup.title and soup.title.text else "N/A")
+    h1_tag = soup.find("h1")
+    h1 = h1_tag.get_text(strip=True) if h1_tag else "N/A"
+    meta = soup.find("meta", attrs={"name": "description"})
+    meta_desc = meta.get("content", "").strip() if meta else "N/A"
+    return title, h1, meta_desc
+
+
+_TEXT_MIME_EXTS = {
+    "text/csv": ".csv",
+    "application/csv": ".csv",
+    "text/plain": ".txt",
+    "application/json": ".json",
+    "text/json": ".json",
+    "application/xml": ".xml",
+    "text/xml": ".xml",
+}
+
+
+@lru_cache(maxsize=10_000)
+def _probe_ext(url: str, timeout: int) -> str:
+    """
+    Header-only probe, cached per URL so a link repeated across pages is probed
+    once. One streamed GET for the first byte: works where HEAD is refused or
+    answered without Content-Disposition, and the response is closed before any
+    body beyond that byte is read. Only definitive answers are cached: network
+    errors, 429 and 5xx raise (lru_cache keeps nothing), so the next crawl retries.
+    """
+    r = get_session().get(url, allow_redirects=True, stream=True, timeout=timeout, headers={"Range": "bytes=0-0"})
+    with r:
+        if r.status_code == 429 or r.status_code >= 500:
+            r.raise_for_status()
+        if r.status_code >= 400:
+            return ""
+        cd = r.headers.get("content-disposition") or ""
+        ct = (r.headers.get("content-type") or "").split(";")[0].strip().lower()
+        if r.status_code == 206:
+            # Drain the single byte so the keep-alive connection goes back to the pool.
+            r.content
+    m = _CD_FILENAME_RE.search(cd) if cd else None
+    if m:
+        ext = os.path.splitext(unquote(m.group(1).strip()))[1].lower()
+        if ext in DEFAULT_FILE_EXTS:
+            return ext
+    # Pages and scripts are ordinary endpoints, not files. Text data types map to
+    # their extension directly (mimetypes guesses ".xsl" for application/xml).
+    if not ct or ct in ("text/html", "application/xhtml+xml") or "javascript" in ct:
+        return ""
+    ext = _TEXT_MIME_EXTS.get(ct) or mimetypes.guess_extension(ct) or ""
+    return ext if ext in DEFAULT_FILE_EXTS else ""
 
-        log("INFO", f"Crawling site: {site}")
-        visited = set()
-        queue = [site]
 
-        pages_crawled = 0
+def probe_ext(url: str, settings: Settings) -> str:
+    """Probe a download-looking link and infer its file extension from the response headers."""
+    try:
+        return _probe_ext(url, int(settings.timeout_seconds))
+    except Exception:
+        # Transient failure: not a file for this crawl, but not remembered either.
+        return ""
+
+
+def _crawl_site(
+    site: str,
+    exts: frozenset,
+    settings: Settings,
+    limiter: _HostLimiter
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """
+    BFS-crawl one site (same host only) and collect file links.
+    Returns (rows, pages attempted, pages actually fetched).
+    Runs in a worker thread, so it must not touch st.session_state.
+    """
+    found: Dict[str, Dict[str, Any]] = {}
+    probed: Dict[str, str] = {}
+    visited = set()
+    seen_bodies = set()
+    start = _canonicalize(site)
+    queue = deque([start])
+    enqueued = {start}
+    site_netloc = _parse(start).netloc
+
+    def fetch(u: str) -> Optional[str]:
+        limiter.acquire(site_netloc)
+        return fetch_html(u, settings)
+
+    pages_crawled = 0
+    pages_fetched = 0
+    with ThreadPoolExecutor(max_workers=max(1, settings.workers)) as pool:
         while queue and pages_crawled < settings.max_pages_per_site:
-            if stop_requested():
-                log("WARN", "Stopped by user.")
-                break
-
-            cur = queue.pop(0)
-            if cur in visited:
-                continue
-            visited.add(cur)
+            # Level-synchronous BFS: fetch a batch of frontier pages concurrently
+            # (the limiter still spaces hits on this host), then parse them in order.
+            batch = []
+            budget = min(settings.workers, settings.max_pages_per_site - pages_crawled)
+            while queue and len(batch) < budget:
+                cur = queue.popleft()
+                if cur in visited:
+                    continue
+                visited.add(cur)
+                batch.append(cur)
+            pages_crawled += len(batch)
 
-            html = fetch_html(cur, settings)
-            pages_crawled += 1
-            time.sleep(settings.delay_seconds)
+            for cur, html in zip(batch, pool.map(fetch, batch)):
+                if not html:
+                    continue
+                pages_fetched += 1
+                # Same body under another URL (session IDs, print views, ...): links already seen.
+                digest = hashlib.blake2b(html.encode("utf-8", "ignore"), digest_size=16).digest()
+                if digest in seen_bodies:
+                    continue
+                seen_bodies.add(digest)
+
+                links = []
+                to_probe = {}
+                for href in extract_hrefs(html):
+                    # In-page anchors and non-HTTP schemes can never be crawled: skip the urljoin.
+                    if _SKIP_HREF_RE.match(href):
+                        continue
+                    abs_url = urljoin(cur, href)
+
+                    if not is_valid_url(abs_url):
+                        continue
+                    abs_url = _canonicalize(abs_url)
+
+                    ext = normalize_ext(abs_url)
+                    hinted = not ext and bool(_HEAD_HINT_RE.search(href))
+                    if hinted and abs_url not in probed:
+                        to_probe[abs_url] = None
+                    links.append((abs_url, ext, hinted))
+
+                # Extension-less download endpoints: one header probe each instead of a
+                # full GET as a "page"; all of a page's probes run concurrently and, being
+                # header-only, don't take slots on the host's page limiter.
+                if to_probe:
+                    for u, e in zip(to_probe, pool.map(lambda u: probe_ext(u, settings), to_probe)):
+                        probed[u] = e
+
+                for abs_url, ext, hinted in links:
+                    if hinted:
+                        ext = probed[abs_url]
+                    if ext and (not exts or ext in exts):
+                        if abs_url in found:
+                            continue
+                        found[abs_url] = {
+                            "Select": False,
+                            "File": os.path.basename(_parse(abs_url).path) or abs_url,
+                            "Type": ext,
+                            "URL": abs_url,
+                            "Source": site
+                        }
+                    else:
+                        if _parse(abs_url).netloc == site_netloc:
+                            if abs_url not in enqueued:
+                                enqueued.add(abs_url)
+                                queue.append(abs_url)
 
-            if not html:
+    return list(found.values()), pages_crawled, pages_fetched
+
+
+class _CrawlNotCached(Exception):
+    """Raised out of _discover_files_cached so a crawl that fetched nothing isn't cached."""
+
+    def __init__(self, df: pd.DataFrame, logs: List[Tuple[str, str]]):
+        super().__init__("no page fetched")
+        self.df = df
+        self.logs = logs
+
+
+@st.cache_data(ttl=3600, max_entries=128, show_spinner=False, hash_funcs={Settings: dataclasses.astuple})
+def _discover_files_cached(
+    sites: Tuple[str, ...],
+    exts: Tuple[str, ...],
+    settings: Settings,
+    _ran: List[bool]
+) -> Tuple[pd.DataFrame, List[Tuple[str, str]]]:
+    """
+    Crawl core, cached per (sites, exts, settings) so reruns with the same
+    selection don't re-crawl. It never touches session state; log lines are
+    returned for the caller to record. _ran is unhashed and only set when the
+    body actually runs, so the caller can tell a cache hit. If no page could be
+    fetched from any site (network down, blocked), _CrawlNotCached is raised
+    instead of returning, so the failure isn't served from cache for an hour.
+    """
+    _ran.append(True)
+    allowed = frozenset(e.lower().strip() for e in exts)
+    found: Dict[str, Dict[str, Any]] = {}
+    logs: List[Tuple[str, str]] = []
+
+    valid_sites = []
+    for site in sites:
+        if not is_valid_url(site):
+            logs.append(("WARN", f"Skipping invalid site URL: {site}"))
+            continue
+        valid_sites.append(site)
+
+    if not valid_sites:
+        return pd.DataFrame(), logs
+
+    # Sites are crawled in parallel; the limiter spaces requests per host.
+    limiter = _HostLimiter(settings.delay_seconds)
+    fetched_total = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(settings.workers, len(valid_sites)))) as ex:
+        futures = [None] * len(valid_sites)
+        for i, site in interleave_by_host(list(enumerate(valid_sites)), key=lambda item: item[1]):
+            logs.append(("INFO", f"Crawling site: {site}"))
+            futures[i] = ex.submit(_crawl_site, site, allowed, settings, limiter)
+
+        # Merge in input order (as the serial crawl did), not completion order,
+        # so the same selection always yields the same table.
+        for site, fut in zip(valid_sites, futures):
+            try:
+                site_found, pages_crawled, pages_fetched = fut.result()
+            except Exception as e:
+                logs.append(("ERROR", f"Crawl failed for {site}: {e}"))
                 continue
+            for row in site_found:
+                found.setdefault(row["URL"], row)
+            fetched_total += pages_fetched
+            logs.append(("OK", f"Finished crawling {site}. Pages crawled: {pages_crawled}"))
 
-            soup = BeautifulSoup(html, "html.parser")
-            for a in soup.select("a[href]"):
-                href = a.get("href", "").strip()
-                if not href:
-                    continue
-                abs_url = urljoin(cur, href)
+    # Rows are already unique by URL.
+    df = pd.DataFrame.from_records(list(found.values()), columns=FILE_COLUMNS)
+    if not fetched_total:
+        raise _CrawlNotCached(df, logs)
+    return df, logs
 
-                if not is_valid_url(abs_url):
-                    continue
-
-                ext = normalize_ext(abs_url)
-                if ext and (not exts or ext in exts):
-                    found.append({
-                        "Select": False,
-                        "File": os.path.basename(urlparse(abs_url).path) or abs_url,
-                        "Type": ext,
-                        "URL": abs_url,
-                        "Source": site
-                    })
-                else:
-                    try:
-                        if urlparse(abs_url).netloc == urlparse(site).netloc:
-                            if abs_url not in visited and abs_url not in queue:
-                                queue.append(abs_url)
-                    except Exception:
-                        pass
 
-        log("OK", f"Finished crawling {site}. Pages crawled: {pages_crawled}")
+def discover_files_from_sites(
+    sites: List[str],
+    exts: List[str],
+    settings: Settings
+) -> pd.DataFrame:
+    if stop_requested():
+        log("WARN", "Stopped by user.")
+        return pd.DataFrame()
 
-    df = pd.DataFrame(found)
-    if df.empty:
+    ran: List[bool] = []
+    try:
+        df, logs = _discover_files_cached(tuple(sites), tuple(sorted(exts)), settings, ran)
+    except _CrawlNotCached as e:
+        df, logs = e.df, e.logs
+    if not ran:
+        # Cache hit: the crawl log lines belong to the earlier run.
+        log("INFO", f"Using cached crawl results for {len(sites)} site(s) ({len(df)} file(s)).")
         return df
-
-    df = df.drop_duplicates(subset=["URL"]).reset_index(drop=True)
+    for level, msg in logs:
+        log(level, msg)
     return df
 
 
 # =========================
 # Download selected files as ZIP
 # =========================
+# Characters that are invalid in Windows/macOS archive member names; one C-level translate per name.
+_UNSAFE_NAME_TABLE = str.maketrans({c: "_" for c in '<>:"\\|?*' + "".join(map(chr, range(32)))})
+
+
+def filename_from_response(r: requests.Response, url: str) -> str:
+    """Prefer the server's Content-Disposition filename, else the URL path basename."""
+    cd = r.headers.get("content-disposition") or ""
+    m = _CD_FILENAME_RE.search(cd) if cd else None
+    if m:
+        name = os.path.basename(unquote(m.group(1).strip()).replace("\\", "/")).translate(_UNSAFE_NAME_TABLE)
+        if name.strip("._ "):
+            return name
+    return os.path.basename(_parse(url).path).translate(_UNSAFE_NAME_TABLE) or f"file_{int(time.time())}"
+
+
+# Formats that are already compressed; deflating them again costs CPU for ~0% gain.
+_ALREADY_COMPRESSED = frozenset({
+    ".xlsx", ".xlsm", ".xlsb", ".pptx", ".docx", ".zip", ".7z", ".rar", ".pdf",
+    ".png", ".jpg", ".jpeg", ".webp", ".gif", ".mp3", ".mp4", ".avi",
+})
+
+
+# Downloads up to this size stay in memory; larger ones spill to a temp file.
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _download_one(url: str, settings: Settings, limiter: _HostLimiter) -> Tuple[str, Union[bytes, str]]:
+    """
+    Stream one file. Returns (archive name, payload), where payload is the
+    bytes for small files or a temp file path once SPOOL_MAX_BYTES is exceeded.
+    """
+    limiter.acquire(_parse(url).netloc)
+    with get_session().get(url, stream=True, timeout=settings.timeout_seconds) as r:
+        r.raise_for_status()
+        name = filename_from_response(r, url)
+        mem = io.BytesIO()
+        f = None
+        try:
+            for chunk in r.iter_content(chunk_size=64 * 1024):
+                if f is None and mem.tell() + len(chunk) > SPOOL_MAX_BYTES:
+                    f = tempfile.NamedTemporaryFile(delete=False)
+                    f.write(mem.getvalue())
+                    mem = None
+                (mem if f is None else f).write(chunk)
+        except Exception:
+            if f is not None:
+                f.close()
+                os.remove(f.name)
+            raise
+    if f is None:
+        return name, mem.getvalue()
+    f.close()
+    return name, f.name
+
+
+def _discard_payload(payload: Union[bytes, str]):
+    if isinstance(payload, str):
+        try:
+            os.remove(payload)
+        except OSError:
+            pass
+
+
 def download_files_as_zip(urls: List[str], settings: Settings) -> bytes:
     buf = io.BytesIO()
     with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for u in urls:
-            if stop_requested():
-                break
-            try:
-                headers = {"User-Agent": settings.user_agent}
-                r = requests.get(u, headers=headers, timeout=settings.timeout_seconds)
-                r.raise_for_status()
-                name = os.path.basename(urlparse(u).path) or f"file_{int(time.time())}"
-                if name in zf.namelist():
-                    base, ext = os.path.splitext(name)
-                    name = f"{base}_{int(time.time())}{ext}"
-                zf.writestr(name, r.content)
-                time.sleep(settings.delay_seconds)
-            except Exception:
-                continue
+        # Downloads run in parallel; only the archive writes happen here on the main thread.
+        limiter = _HostLimiter(settings.delay_seconds)
+        names = set()
+        with ThreadPoolExecutor(max_workers=max(1, settings.workers)) as ex:
+            futures = [None] * len(urls)
+            for i, u in interleave_by_host(list(enumerate(urls)), key=lambda item: item[1]):
+                futures[i] = ex.submit(_download_one, u, settings, limiter)
+            # Written in input order, not completion order, so entry order and the
+            # _1/_2 suffixes on clashing names are the same on every run.
+            for fut in futures:
+                if stop_requested():
+                    break
+                try:
+                    name, payload = fut.result()
+                except Exception:
+                    continue
+                try:
+                    if name in names:
+                        # Counter suffix: unique even for several clashes within one second.
+                        base, ext = os.path.splitext(name)
+                        n = 1
+                        while f"{base}_{n}{ext}" in names:
+                            n += 1
+                        name = f"{base}_{n}{ext}"
+                    names.add(name)
+                    if os.path.splitext(name)[1].lower() in _ALREADY_COMPRESSED:
+                        opts = {"compress_type": zipfile.ZIP_STORED}
+                    else:
+                        opts = {"compress_type": zipfile.ZIP_DEFLATED, "compresslevel": 1}
+                    if isinstance(payload, bytes):
+                        zf.writestr(name, payload, **opts)
+                    else:
+                        zf.write(payload, arcname=name, **opts)
+                finally:
+                    _discard_payload(payload)
+
+            # Stopped early: drop queued downloads and clean up temp files already written.
+            for fut in futures:
+                if fut.cancel():
+                    continue
+                try:
+                    _discard_payload(fut.result()[1])
+                except Exception:
+                    pass
     buf.seek(0)
     return buf.read()
 
@@ -380,10 +928,14 @@ def download_files_as_zip(urls: List[str], settings: Settings) -> bytes:
 # =========================
 # YouTube Extraction
 # =========================
+_ISO8601_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
+@lru_cache(maxsize=4096)
 def _iso8601_duration_to_hms(d: str) -> str:
     if not d or not isinstance(d, str):
         return "N/A"
-    m = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", d)
+    m = _ISO8601_RE.match(d)
     if not m:
         return d
     h = int(m.group(1) or 0)
@@ -392,17 +944,22 @@ def _iso8601_duration_to_hms(d: str) -> str:
     return f"{h:02d}:{mi:02d}:{s:02d}"
 
 
-def is_youtube_url(s: str) -> bool:
+def _yt_parsed(u) -> ParseResult:
+    """Accept a URL string or an already-parsed URL; strings go through the memoized parser."""
+    return _parse(u.strip()) if isinstance(u, str) else u
+
+
+def is_youtube_url(s) -> bool:
     try:
-        u = urlparse(s.strip())
+        u = _yt_parsed(s)
         return u.scheme in ("http", "https") and ("youtube.com" in u.netloc or "youtu.be" in u.netloc)
     except Exception:
         return False
 
 
-def parse_youtube_video_id(url: str) -> Optional[str]:
+def parse_youtube_video_id(url) -> Optional[str]:
     try:
-        u = urlparse(url.strip())
+        u = _yt_parsed(url)
         if "youtu.be" in u.netloc:
             vid = u.path.strip("/").split("/")[0]
             return vid or None
@@ -418,9 +975,9 @@ def parse_youtube_video_id(url: str) -> Optional[str]:
         return None
 
 
-def parse_youtube_channel_id(url: str) -> Optional[str]:
+def parse_youtube_channel_id(url) -> Optional[str]:
     try:
-        u = urlparse(url.strip())
+        u = _yt_parsed(url)
         if "youtube.com" not in u.netloc:
             return None
         parts = [p for p in u.path.split("/") if p]
@@ -431,22 +988,41 @@ def parse_youtube_channel_id(url: str) -> Optional[str]:
         return None
 
 
-def youtube_api_get(endpoint: str, params: dict, timeout: int = 20) -> dict:
+def parse_youtube_url(s: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Parse once and return (is_youtube, video_id, channel_id)."""
+    try:
+        u = _yt_parsed(s)
+    except Exception:
+        return False, None, None
+    if not is_youtube_url(u):
+        return False, None, None
+    return True, parse_youtube_video_id(u), parse_youtube_channel_id(u)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _youtube_api_get_cached(endpoint: str, params: Tuple[Tuple[str, Any], ...], timeout: int, _api_key: str) -> dict:
     base = "https://www.googleapis.com/youtube/v3/"
-    r = requests.get(base + endpoint, params=params, timeout=timeout)
+    r = get_session().get(base + endpoint, params={**dict(params), "key": _api_key}, timeout=timeout)
     r.raise_for_status()
-    return r.json()
+    return response_json(r)
+
+
+def youtube_api_get(endpoint: str, params: dict, timeout: int = 20) -> dict:
+    """GET a YouTube Data API endpoint; identical requests are served from cache for 5 minutes."""
+    params = dict(params)
+    api_key = params.pop("key", "")
+    return _youtube_api_get_cached(endpoint, tuple(sorted(params.items())), timeout, api_key)
 
 
 def resolve_channel_id_from_url_or_text(text: str, api_key: str, timeout: int = 20) -> Optional[str]:
     text = text.strip()
 
-    if is_youtube_url(text):
-        cid = parse_youtube_channel_id(text)
+    is_yt, _, cid = parse_youtube_url(text)
+    if is_yt:
         if cid:
             return cid
 
-        u = urlparse(text)
+        u = _parse(text)
         parts = [p for p in u.path.split("/") if p]
         token = None
         if parts:
@@ -501,56 +1077,73 @@ def resolve_channel_id_from_url_or_text(text: str, api_key: str, timeout: int =
     return None
 
 
-def youtube_list_channel_video_ids(channel_id: str, api_key: str, max_items: int, timeout: int = 20) -> list:
-    ids = []
+def _iter_search_id_pages(params: dict, max_items: int, timeout: int = 20) -> Iterator[List[str]]:
+    """
+    Page through a YouTube search and yield each page's video IDs as soon as it
+    arrives, so callers can start fetching details before the next page.
+    Yields at most max_items IDs in total, de-duplicated across pages.
+    """
+    seen = set()
     page_token = None
 
-    while len(ids) < max_items:
-        params = {
-            "part": "id",
-            "channelId": channel_id,
-            "type": "video",
-            "order": "date",
-            "maxResults": 50,
-            "key": api_key
-        }
+    while len(seen) < max_items:
+        page_params = dict(params, maxResults=50)
         if page_token:
-            params["pageToken"] = page_token
+            page_params["pageToken"] = page_token
 
-        data = youtube_api_get("search", params, timeout=timeout)
+        data = youtube_api_get("search", page_params, timeout=timeout)
+        batch = []
         for item in data.get("items", []):
             vid = item.get("id", {}).get("videoId")
-            if vid:
-                ids.append(vid)
-                if len(ids) >= max_items:
+            if vid and vid not in seen:
+                seen.add(vid)
+                batch.append(vid)
+                if len(seen) >= max_items:
                     break
+        if batch:
+            yield batch
 
         page_token = data.get("nextPageToken")
         if not page_token:
             break
 
-    seen = set()
-    out = []
-    for v in ids:
-        if v not in seen:
-            out.append(v)
-            seen.add(v)
-    return out
+
+def youtube_list_channel_video_ids(channel_id: str, api_key: str, max_items: int, timeout: int = 20) -> Iterator[List[str]]:
+    params = {"part": "id", "channelId": channel_id, "type": "video", "order": "date", "key": api_key}
+    return _iter_search_id_pages(params, max_items, timeout=timeout)
+
+
+def youtube_search_video_ids(query: str, api_key: str, max_items: int, timeout: int = 20) -> Iterator[List[str]]:
+    params = {"part": "id", "q": query, "type": "video", "key": api_key}
+    return _iter_search_id_pages(params, max_items, timeout=timeout)
+
+
+# Shared read-only stand-in for missing API sub-objects (avoids a fresh {} per miss).
+_EMPTY = MappingProxyType({})
 
 
 def youtube_video_details(video_ids: list, api_key: str, timeout: int = 20) -> list:
     details = []
-    for i in range(0, len(video_ids), 50):
-        chunk = video_ids[i:i+50]
-        data = youtube_api_get(
-            "videos",
-            {"part": "snippet,contentDetails,statistics", "id": ",".join(chunk), "key": api_key},
-            timeout=timeout
-        )
+    params_list = [
+        {"part": "snippet,contentDetails,statistics", "id": ",".join(video_ids[i:i+50]), "key": api_key}
+        for i in range(0, len(video_ids), 50)
+    ]
+    if not params_list:
+        return details
+
+    if len(params_list) == 1:
+        # The pipelined search path always lands here (one page = at most 50 IDs): no pool.
+        pages = [youtube_api_get("videos", params_list[0], timeout=timeout)]
+    else:
+        # Batches are independent, so fetch them concurrently; map() keeps the original order.
+        with ThreadPoolExecutor(max_workers=min(8, len(params_list))) as ex:
+            pages = list(ex.map(lambda p: youtube_api_get("videos", p, timeout=timeout), params_list))
+
+    for data in pages:
         for it in data.get("items", []):
-            sn = it.get("snippet", {}) or {}
-            stt = it.get("statistics", {}) or {}
-            cd = it.get("contentDetails", {}) or {}
+            sn = it.get("snippet") or _EMPTY
+            stt = it.get("statistics") or _EMPTY
+            cd = it.get("contentDetails") or _EMPTY
             vid = it.get("id", "")
 
             details.append({
@@ -567,67 +1160,81 @@ def youtube_video_details(video_ids: list, api_key: str, timeout: int = 20) -> l
     return details
 
 
+def _youtube_details_pipelined(id_pages: Iterator[List[str]], api_key: str, timeout: int = 20) -> List[Dict[str, Any]]:
+    """
+    Submit the details lookup for each search page while the next page is
+    still being fetched, then collect results in search order.
+    """
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(youtube_video_details, ids, api_key, timeout) for ids in id_pages]
+        return [row for fut in futures for row in fut.result()]
+
+
 def youtube_extract(first_line: str, max_items: int, settings: Settings) -> List[Dict[str, Any]]:
     if not YOUTUBE_API_KEY:
         raise RuntimeError("YOUTUBE_API_KEY is missing. Add it to .streamlit/secrets.toml or environment variables.")
 
+    timeout = settings.timeout_seconds
     first_line = first_line.strip()
-    if is_youtube_url(first_line):
-        vid = parse_youtube_video_id(first_line)
+    is_yt, vid, cid = parse_youtube_url(first_line)
+    if is_yt:
         if vid:
-            return youtube_video_details([vid], YOUTUBE_API_KEY, timeout=settings.timeout_seconds)
+            return youtube_video_details([vid], YOUTUBE_API_KEY, timeout=timeout)
 
-        cid = resolve_channel_id_from_url_or_text(first_line, YOUTUBE_API_KEY, timeout=settings.timeout_seconds)
+        cid = cid or resolve_channel_id_from_url_or_text(first_line, YOUTUBE_API_KEY, timeout=timeout)
         if cid:
-            vids = youtube_list_channel_video_ids(cid, YOUTUBE_API_KEY, max_items=max_items, timeout=settings.timeout_seconds)
-            return youtube_video_details(vids, YOUTUBE_API_KEY, timeout=settings.timeout_seconds)
-
-        q = first_line
-    else:
-        q = first_line
+            pages = youtube_list_channel_video_ids(cid, YOUTUBE_API_KEY, max_items=max_items, timeout=timeout)
+            return _youtube_details_pipelined(pages, YOUTUBE_API_KEY, timeout=timeout)
 
-    ids = []
-    page_token = None
+    pages = youtube_search_video_ids(first_line, YOUTUBE_API_KEY, max_items=max_items, timeout=timeout)
+    return _youtube_details_pipelined(pages, YOUTUBE_API_KEY, timeout=timeout)
 
-    while len(ids) < max_items:
-        params = {
-            "part": "id",
-            "q": q,
-            "type": "video",
-            "maxResults": 50,
-            "key": YOUTUBE_API_KEY,
-        }
-        if page_token:
-            params["pageToken"] = page_token
 
-        data = youtube_api_get("search", params, timeout=settings.timeout_seconds)
-
-        for it in data.get("items", []):
-            vid = it.get("id", {}).get("videoId")
-            if vid:
-                ids.append(vid)
-                if len(ids) >= max_items:
-                    break
-
-        page_token = data.get("nextPageToken")
-        if not page_token:
-            break
-
-    ids = ids[:max_items]
-    return youtube_video_details(ids, YOUTUBE_API_KEY, timeout=settings.timeout_seconds)
+# =========================
+# Generic Website Extraction
+# =========================
+def generic_extract_row(url: str, columns: List[str], settings: Settings, limiter: _HostLimiter) -> Dict[str, Any]:
+    """Fetch one page and fill the basic columns (URL, Page Title, H1, Meta Description)."""
+    limiter.acquire(_parse(url).netloc)
+    html = fetch_html(url, settings)
+    row = {c: "N/A" for c in columns}
+    if "URL" in row:
+        row["URL"] = url
+
+    if html:
+        title, h1, meta_desc = extract_page_meta(html)
+
+        if "Page Title" in row:
+            row["Page Title"] = title
+        if "H1" in row:
+            row["H1"] = h1
+        if "Meta Description" in row:
+            row["Meta Description"] = meta_desc
+    return row
 
 
 # =========================
 # Exporters (bytes)
 # =========================
+def _prepare_df(rows: List[Dict[str, Any]], columns: List[str]) -> pd.DataFrame:
+    """Rows as a DataFrame projected onto `columns`; missing columns are filled with "N/A" in one pass."""
+    return pd.DataFrame(rows).reindex(columns=columns or None, fill_value="N/A")
+
+
 def export_csv_bytes(rows: List[Dict[str, Any]], columns: List[str]) -> bytes:
-    df = pd.DataFrame(rows)
-    if columns:
-        for c in columns:
-            if c not in df.columns:
-                df[c] = "N/A"
-        df = df[columns]
-    return df.to_csv(index=False).encode("utf-8")
+    # Rows are already dicts, so write them directly instead of building a DataFrame.
+    fieldnames = columns or list(dict.fromkeys(k for r in rows for k in r))
+    buf = io.StringIO()
+    w = csv.DictWriter(
+        buf,
+        fieldnames=fieldnames,
+        extrasaction="ignore",
+        restval="N/A" if columns else "",
+        lineterminator="\n",
+    )
+    w.writeheader()
+    w.writerows(rows)
+    return buf.getvalue().encode("utf-8")
 
 
 def export_json_bytes(rows: List[Dict[str, Any]], columns: List[str]) -> bytes:
@@ -635,17 +1242,42 @@ def export_json_bytes(rows: List[Dict[str, Any]], columns: List[str]) -> bytes:
         rows2 = [{c: r.get(c, "N/A") for c in columns} for r in rows]
     else:
         rows2 = rows
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(rows2, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
     return json.dumps(rows2, indent=2, ensure_ascii=False).encode("utf-8")
 
 
 def export_xlsx_bytes(rows: List[Dict[str, Any]], columns: List[str], meta: Dict[str, Any]) -> bytes:
     out = io.BytesIO()
-    df = pd.DataFrame(rows)
-    if columns:
-        for c in columns:
-            if c not in df.columns:
-                df[c] = "N/A"
-        df = df[columns]
+
+    if XLSX_ENGINE == "xlsxwriter":
+        # constant_memory flushes each row as soon as the next one starts, so rows
+        # must be written in order; pandas writes column by column, so write directly.
+        cols = columns or list(dict.fromkeys(k for r in rows for k in r))
+        default = "N/A" if columns else None
+        # Plain strings only, like the openpyxl path: no auto hyperlinks (2079-char and
+        # 65,530-per-sheet limits), no "=..." formulas from scraped text, no number coercion.
+        wb = xlsxwriter.Workbook(out, {
+            "constant_memory": True,
+            "strings_to_urls": False,
+            "strings_to_formulas": False,
+            "strings_to_numbers": False,
+        })
+        ws = wb.add_worksheet("Data")
+        ws.write_row(0, 0, cols)
+        for i, r in enumerate(rows, start=1):
+            ws.write_row(i, 0, [
+                v if v is None or isinstance(v, (str, int, float)) else str(v)
+                for v in (r.get(c, default) for c in cols)
+            ])
+        ms = wb.add_worksheet("Metadata")
+        ms.write_row(0, 0, ["Key", "Value"])
+        for i, (k, v) in enumerate(meta.items(), start=1):
+            ms.write_row(i, 0, [k, str(v)])
+        wb.close()
+        return out.getvalue()
+
+    df = _prepare_df(rows, columns)
 
     with pd.ExcelWriter(out, engine="openpyxl") as writer:
         df.to_excel(writer, index=False, sheet_name="Data")
@@ -657,69 +1289,64 @@ def export_xlsx_bytes(rows: List[Dict[str, Any]], columns: List[str], meta: Dict
 
 
 def export_sqlite_bytes(rows: List[Dict[str, Any]], columns: List[str]) -> bytes:
-    df = pd.DataFrame(rows)
-    if columns:
-        for c in columns:
-            if c not in df.columns:
-                df[c] = "N/A"
-        df = df[columns]
+    cols = columns or list(dict.fromkeys(k for r in rows for k in r))
+    default = "N/A" if columns else None
+    quoted = ['"' + c.replace('"', '""') + '"' for c in cols]
 
     con = sqlite3.connect(":memory:")
-    df.to_sql("data", con, if_exists="replace", index=False)
-
-    import tempfile
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        path = f.name
-    con2 = sqlite3.connect(path)
-    con.backup(con2)
-    con2.close()
+    if cols:
+        con.execute(f"CREATE TABLE data ({', '.join(q + ' TEXT' for q in quoted)})")
+        con.executemany(
+            f"INSERT INTO data ({', '.join(quoted)}) VALUES ({', '.join('?' * len(cols))})",
+            ([None if (v := r.get(c, default)) is None else str(v) for c in cols] for r in rows)
+        )
+    con.commit()
+    # serialize() (Python 3.11+) hands back the DB image without a temp-file round trip.
+    data = bytes(con.serialize())
     con.close()
-    with open(path, "rb") as f:
-        data = f.read()
-    try:
-        os.remove(path)
-    except Exception:
-        pass
     return data
 
 
-def export_pdf_bytes(rows: List[Dict[str, Any]], columns: List[str], title: str) -> Optional[bytes]:
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-        from reportlab.lib import colors
-        from reportlab.lib.styles import getSampleStyleSheet
-    except Exception:
-        return None
+PDF_ROWS_PER_TABLE = 40
 
-    df = pd.DataFrame(rows)
-    if df.empty:
+
+@lru_cache(maxsize=1)
+def _pdf_styles():
+    """Sample stylesheet and table style, built once; both are only read afterwards."""
+    table_style = TableStyle([
+        ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#0B3D91")),
+        ("TEXTCOLOR", (0,0), (-1,0), colors.white),
+        ("GRID", (0,0), (-1,-1), 0.25, colors.grey),
+        ("FONTSIZE", (0,0), (-1,-1), 8),
+        ("VALIGN", (0,0), (-1,-1), "TOP"),
+    ])
+    return getSampleStyleSheet(), table_style
+
+
+def export_pdf_bytes(rows: List[Dict[str, Any]], columns: List[str], title: str) -> Optional[bytes]:
+    if not REPORTLAB_AVAILABLE or not rows:
         return None
-    if columns:
-        for c in columns:
-            if c not in df.columns:
-                df[c] = "N/A"
-        df = df[columns]
 
-    df = df.head(200)
+    cols = columns or list(dict.fromkeys(k for r in rows for k in r))
 
     buf = io.BytesIO()
     doc = SimpleDocTemplate(buf, pagesize=letter)
-    styles = getSampleStyleSheet()
+    styles, table_style = _pdf_styles()
     elements = []
     elements.append(Paragraph(title, styles["Title"]))
     elements.append(Spacer(1, 12))
 
-    data = [list(df.columns)] + df.astype(str).values.tolist()
-    table = Table(data, repeatRows=1)
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0,0), (-1,0), colors.HexColor("#0B3D91")),
-        ("TEXTCOLOR", (0,0), (-1,0), colors.white),
-        ("GRID", (0,0), (-1,-1), 0.25, colors.grey),
-        ("FONTSIZE", (0,0), (-1,-1), 8),
-        ("VALIGN", (0,0), (-1,-1), "TOP"),
-    ]))
-    elements.append(table)
+    # Straight from the row dicts; no DataFrame copy just to stringify 200 rows.
+    header = list(cols)
+    body = [
+        ["" if (v := r.get(c, "N/A")) is None else str(v) for c in cols]
+        for r in rows[:200]
+    ]
+    # Page-sized tables: ReportLab re-splits one long table on every page break.
+    for i in range(0, len(body), PDF_ROWS_PER_TABLE):
+        table = Table([header] + body[i:i + PDF_ROWS_PER_TABLE], repeatRows=1)
+        table.setStyle(table_style)
+        elements.append(table)
     doc.build(elements)
     buf.seek(0)
     return buf.read()
@@ -730,6 +1357,26 @@ def default_filename(prefix: str, ext: str) -> str:
     return f"{prefix}_{ts}.{ext}"
 
 
+def paged_data_editor(df: pd.DataFrame, key: str, page_size: int, **kwargs) -> pd.DataFrame:
+    """
+    Show one page of `df` in st.data_editor, so a tick only ships that slice to
+    the browser. Select edits are merged back and the full frame is returned.
+    """
+    n_pages = max(1, -(-len(df) // page_size))
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    page = 1
+    if n_pages > 1:
+        page = int(st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key, help=f"{n_pages} pages"))
+
+    start = (page - 1) * page_size
+    view = df.iloc[start:start + page_size]
+    edited = st.data_editor(view, **kwargs)
+    df.loc[view.index, "Select"] = edited["Select"].values
+    return df
+
+
 # =========================
 # Header
 # =========================
@@ -751,16 +1398,19 @@ st.sidebar.markdown("## Controls")
 delay = st.sidebar.slider("Request delay (seconds)", 0.0, 5.0, 2.0, 0.25)
 max_pages = st.sidebar.slider("Max pages per site (crawl)", 1, 50, 10, 1)
 timeout = st.sidebar.slider("Timeout (seconds)", 5, 60, 20, 1)
+workers = st.sidebar.slider("Parallel workers", 1, 16, 8, 1)
 
 settings = Settings(
     delay_seconds=float(delay),
     timeout_seconds=int(timeout),
     max_pages_per_site=int(max_pages),
+    workers=int(workers),
 )
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("## Search settings")
 search_k = st.sidebar.slider("Number of search results", 1, 100, 30, 5)
+page_size = st.sidebar.slider("Rows per page (result tables)", 50, 1000, 200, 50)
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("## File types")
@@ -783,6 +1433,10 @@ if st.sidebar.button("Reset"):
     st.session_state.files_df = pd.DataFrame()
     st.session_state.extract_rows = []
     log("INFO", "Reset completed.")
+if st.sidebar.button("Clear cache"):
+    serper_search.clear()
+    _discover_files_cached.clear()
+    log("INFO", "Search and crawl caches cleared.")
 
 
 # =========================
@@ -825,7 +1479,7 @@ with tab_search:
         else:
             try:
                 log("INFO", f"Searching web: {query} (results={search_k})")
-                df = serper_search(query.strip(), num_results=int(search_k), timeout=settings.timeout_seconds)
+                df = serper_search(query.strip(), num_results=int(search_k), timeout=settings.timeout_seconds, api_key=SERPER_API_KEY)
                 st.info(f"Search results returned: {len(df)}")
                 if df.empty:
                     log("WARN", "No search results returned.")
@@ -842,8 +1496,10 @@ with tab_search:
         st.markdown("### Search results (tick Select to choose sites)")
         sdf = st.session_state.search_df.copy()
 
-        edited = st.data_editor(
+        edited = paged_data_editor(
             sdf,
+            "search",
+            page_size,
             use_container_width=True,
             hide_index=True,
             column_config={
@@ -887,8 +1543,10 @@ with tab_search:
         st.markdown("### Step 2 — Select files to download")
         fdf = st.session_state.files_df.copy()
 
-        fedited = st.data_editor(
+        fedited = paged_data_editor(
             fdf,
+            "files",
+            page_size,
             use_container_width=True,
             hide_index=True,
             column_config={
@@ -983,7 +1641,7 @@ with tab_extract:
             "OR\nhttps://www.youtube.com/watch?v=..."
         )
     elif platform == "BBS (All Years Archive)":
-        st.write("Input: **keywords** (one per line). Build archive once, then search instantly.")
+        st.write("Input: **keywords** (one per line). Build archive once, then search instantly. Keywords match word starts (\"rice\" finds \"rice\" and \"ricefield\"); if nothing matches, a slower substring search runs instead.")
         placeholder = (
             "Example keywords (one per line):\n"
             "Egg price\nlayers\nDOC\n\n"
@@ -1089,32 +1747,32 @@ with tab_extract:
                 else:
                     urls = [u for u in lines if is_valid_url(u)]
                     log("INFO", f"Running generic extraction on {len(urls)} URLs...")
-                    for i, u in enumerate(urls, start=1):
-                        if stop_requested():
-                            log("WARN", "Stopped by user.")
-                            break
-                        html = fetch_html(u, settings)
-                        row = {c: "N/A" for c in columns}
-                        if "URL" in row:
-                            row["URL"] = u
-
-                        if html:
-                            soup = BeautifulSoup(html, "html.parser")
-                            title = (soup.title.text.strip() if soup.title and soup.title.text else "N/A")
-                            h1 = (soup.find("h1").get_text(strip=True) if soup.find("h1") else "N/A")
-                            meta = soup.find("meta", attrs={"name": "description"})
-                            meta_desc = meta.get("content", "").strip() if meta else "N/A"
-
-                            if "Page Title" in row:
-                                row["Page Title"] = title
-                            if "H1" in row:
-                                row["H1"] = h1
-                            if "Meta Description" in row:
-                                row["Meta Description"] = meta_desc
-
-                        st.session_state.extract_rows.append(row)
-                        prog.progress(int((i / max(1, len(urls))) * 100), text=f"Extracted {i}/{len(urls)}")
-                        time.sleep(settings.delay_seconds)
+                    # Hosts are fetched concurrently; the limiter keeps the delay between hits on one host.
+                    limiter = _HostLimiter(settings.delay_seconds)
+                    results: Dict[int, Dict[str, Any]] = {}
+                    with ThreadPoolExecutor(max_workers=max(1, settings.workers)) as ex:
+                        futures = {
+                            ex.submit(generic_extract_row, u, columns, settings, limiter): idx
+                            for idx, u in interleave_by_host(list(enumerate(urls)), key=lambda t: t[1])
+                        }
+                        for i, fut in enumerate(as_completed(futures), start=1):
+                            if stop_requested():
+                                log("WARN", "Stopped by user.")
+                                for f in futures:
+                                    f.cancel()
+                                break
+                            idx = futures[fut]
+                            try:
+                                results[idx] = fut.result()
+                            except Exception as e:
+                                # One bad page must not discard the rows already collected.
+                                log("ERROR", f"Extraction failed for {urls[idx]}: {e}")
+                                row = {c: "N/A" for c in columns}
+                                if "URL" in row:
+                                    row["URL"] = urls[idx]
+                                results[idx] = row
+                            prog.progress(int((i / max(1, len(urls))) * 100), text=f"Extracted {i}/{len(urls)}")
+                    st.session_state.extract_rows.extend(results[idx] for idx in sorted(results))
 
                 prog.progress(100, text="Extraction finished.")
                 log("OK", f"Extraction complete. Rows: {len(st.session_state.extract_rows)}")
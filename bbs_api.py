@@ -2,12 +2,16 @@
 import time
 import sqlite3
 import html
-from typing import List, Dict, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
 BBS_API_BASE = "https://www.bbs.bt/wp-json/wp/v2"
+BACKFILL_BATCH_SIZE = 500
 
 
 def wp_text(s: str) -> str:
@@ -34,35 +38,107 @@ def init_bbs_db(db_path: str):
     """)
     cur.execute("CREATE INDEX IF NOT EXISTS idx_bbs_date ON bbs_posts(date)")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_bbs_title ON bbs_posts(title)")
+    init_bbs_fts(con)
     con.commit()
     return con
 
 
-def upsert_bbs_post(con: sqlite3.Connection, p: Dict[str, Any]):
-    post_id = int(p.get("id"))
-    title = wp_text((p.get("title") or {}).get("rendered", ""))
-    excerpt = wp_text((p.get("excerpt") or {}).get("rendered", ""))
-    content = wp_text((p.get("content") or {}).get("rendered", ""))
-
-    con.execute("""
-    INSERT INTO bbs_posts (id, date, modified, link, title, excerpt, content)
-    VALUES (?, ?, ?, ?, ?, ?, ?)
-    ON CONFLICT(id) DO UPDATE SET
-        date=excluded.date,
-        modified=excluded.modified,
-        link=excluded.link,
-        title=excluded.title,
-        excerpt=excluded.excerpt,
-        content=excluded.content
-    """, (
-        post_id,
+def init_bbs_fts(con: sqlite3.Connection) -> bool:
+    """
+    Full-text index over title/excerpt/content, kept in sync by triggers.
+    Returns False when this SQLite build has no FTS5 (search falls back to LIKE).
+    """
+    exists = con.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='bbs_posts_fts'"
+    ).fetchone()
+    try:
+        con.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS bbs_posts_fts USING fts5(
+            title, excerpt, content,
+            content='bbs_posts', content_rowid='id', tokenize='unicode61'
+        );
+        CREATE TRIGGER IF NOT EXISTS bbs_posts_ai AFTER INSERT ON bbs_posts BEGIN
+            INSERT INTO bbs_posts_fts(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, new.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS bbs_posts_ad AFTER DELETE ON bbs_posts BEGIN
+            INSERT INTO bbs_posts_fts(bbs_posts_fts, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS bbs_posts_au AFTER UPDATE ON bbs_posts BEGIN
+            INSERT INTO bbs_posts_fts(bbs_posts_fts, rowid, title, excerpt, content)
+            VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+            INSERT INTO bbs_posts_fts(rowid, title, excerpt, content)
+            VALUES (new.id, new.title, new.excerpt, new.content);
+        END;
+        """)
+    except sqlite3.OperationalError:
+        return False
+    if not exists:
+        # Archives built before the index existed: index the rows already stored.
+        con.execute("INSERT INTO bbs_posts_fts(bbs_posts_fts) VALUES ('rebuild')")
+    return True
+
+
+_UPSERT_SQL = """
+INSERT INTO bbs_posts (id, date, modified, link, title, excerpt, content)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    date=excluded.date,
+    modified=excluded.modified,
+    link=excluded.link,
+    title=excluded.title,
+    excerpt=excluded.excerpt,
+    content=excluded.content
+"""
+
+
+def bbs_post_row(p: Dict[str, Any]) -> tuple:
+    """WP post JSON -> bbs_posts row tuple, in _UPSERT_SQL column order."""
+    return (
+        int(p.get("id")),
         p.get("date", ""),
         p.get("modified", ""),
         p.get("link", ""),
-        title,
-        excerpt,
-        content
-    ))
+        wp_text((p.get("title") or {}).get("rendered", "")),
+        wp_text((p.get("excerpt") or {}).get("rendered", "")),
+        wp_text((p.get("content") or {}).get("rendered", "")),
+    )
+
+
+def upsert_bbs_post(con: sqlite3.Connection, p: Dict[str, Any]):
+    con.execute(_UPSERT_SQL, bbs_post_row(p))
+
+
+def make_bbs_session(user_agent: str, pool_maxsize: int = 8) -> requests.Session:
+    """Keep-alive session for the BBS API, so pages reuse one TCP/TLS connection pool."""
+    s = requests.Session()
+    s.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
+    s.headers["User-Agent"] = user_agent
+    return s
+
+
+def _get_posts_page(
+    session: requests.Session,
+    page: int,
+    per_page: int,
+    timeout_seconds: int
+) -> Tuple[List[Dict[str, Any]], int]:
+    """One /posts page plus the X-WP-TotalPages count (0 if absent)."""
+    params = {"per_page": min(max(per_page, 1), 100), "page": page}
+    url = f"{BBS_API_BASE}/posts"
+
+    r = session.get(url, params=params, timeout=timeout_seconds)
+
+    if r.status_code == 400:   # out of range page
+        return [], 0
+
+    r.raise_for_status()
+    try:
+        total_pages = int(r.headers.get("X-WP-TotalPages") or 0)
+    except ValueError:
+        total_pages = 0
+    return r.json() or [], total_pages
 
 
 def bbs_iter_all_posts(
@@ -70,37 +146,69 @@ def bbs_iter_all_posts(
     timeout_seconds: int,
     delay_seconds: float,
     stop_fn=None,
-    per_page: int = 100
+    per_page: int = 100,
+    workers: int = 4,
+    session: Optional[requests.Session] = None
 ):
     """
     Iterate through ALL posts using WP pagination.
-    WP returns HTTP 400 when page exceeds max -> stop.
+    Page 1 reports X-WP-TotalPages, so the remaining pages are fetched
+    concurrently (request starts still spaced by delay_seconds) and yielded
+    in page order. Without that header, pages are walked one by one until
+    WP returns HTTP 400 (page exceeds max).
     """
-    headers = {"User-Agent": user_agent}
-    page = 1
-
-    while True:
+    # A session created here is ours to close, whether iteration finishes, fails or is abandoned.
+    owned = session is None
+    session = session or make_bbs_session(user_agent, pool_maxsize=max(1, workers))
+    try:
         if stop_fn and stop_fn():
-            break
+            return
+        data, total_pages = _get_posts_page(session, 1, per_page, timeout_seconds)
+        yield from data
+        if not data:
+            return
 
-        params = {"per_page": min(max(per_page, 1), 100), "page": page}
-        url = f"{BBS_API_BASE}/posts"
+        if total_pages:
+            lock = threading.Lock()
+            next_at = [time.monotonic() + delay_seconds]
 
-        r = requests.get(url, headers=headers, params=params, timeout=timeout_seconds)
+            def fetch(page: int) -> List[Dict[str, Any]]:
+                with lock:
+                    at = next_at[0]
+                    next_at[0] = max(at, time.monotonic()) + delay_seconds
+                wait = at - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                return _get_posts_page(session, page, per_page, timeout_seconds)[0]
 
-        if r.status_code == 400:   # out of range page
-            break
+            ex = ThreadPoolExecutor(max_workers=max(1, workers))
+            try:
+                futures = [ex.submit(fetch, page) for page in range(2, total_pages + 1)]
+                for fut in futures:
+                    if stop_fn and stop_fn():
+                        break
+                    yield from fut.result()
+            finally:
+                ex.shutdown(wait=False, cancel_futures=True)
+            return
 
-        r.raise_for_status()
-        data = r.json()
-        if not data:
-            break
+        page = 2
+        while True:
+            if stop_fn and stop_fn():
+                break
+
+            time.sleep(delay_seconds)
+            data, _ = _get_posts_page(session, page, per_page, timeout_seconds)
+            if not data:
+                break
 
-        for p in data:
-            yield p
+            for p in data:
+                yield p
 
-        page += 1
-        time.sleep(delay_seconds)
+            page += 1
+    finally:
+        if owned:
+            session.close()
 
 
 def bbs_backfill_all_years(
@@ -109,30 +217,43 @@ def bbs_backfill_all_years(
     timeout_seconds: int,
     delay_seconds: float,
     stop_fn=None,
-    per_page: int = 100
+    per_page: int = 100,
+    session: Optional[requests.Session] = None
 ) -> int:
     """
     One-time: save ALL posts (all years) into SQLite.
     Returns total rows in DB after backfill.
     """
     con = init_bbs_db(db_path)
-    count = 0
+    # WAL + synchronous=NORMAL: commits skip the fsync but the archive stays consistent.
+    con.execute("PRAGMA journal_mode=WAL")
+    con.execute("PRAGMA synchronous=NORMAL")
 
-    for p in bbs_iter_all_posts(
+    # One transaction for the whole backfill, flushed to SQLite in executemany batches.
+    buf = []
+    posts = bbs_iter_all_posts(
         user_agent=user_agent,
         timeout_seconds=timeout_seconds,
         delay_seconds=delay_seconds,
         stop_fn=stop_fn,
-        per_page=per_page
-    ):
-        if stop_fn and stop_fn():
-            break
-        upsert_bbs_post(con, p)
-        count += 1
-        if count % 100 == 0:
-            con.commit()
-
-    con.commit()
+        per_page=per_page,
+        session=session
+    )
+    try:
+        for p in posts:
+            if stop_fn and stop_fn():
+                break
+            buf.append(bbs_post_row(p))
+            if len(buf) >= BACKFILL_BATCH_SIZE:
+                con.executemany(_UPSERT_SQL, buf)
+                buf.clear()
+    finally:
+        # Closing the iterator (also after a stop) closes the session it created.
+        posts.close()
+        # Keep whatever was fetched even if a later page fails.
+        if buf:
+            con.executemany(_UPSERT_SQL, buf)
+        con.commit()
 
     cur = con.cursor()
     cur.execute("SELECT COUNT(*) FROM bbs_posts")
@@ -153,23 +274,24 @@ def bbs_search_local(
     con = sqlite3.connect(db_path)
     con.row_factory = sqlite3.Row
 
-    clauses = []
-    params = []
-    for k in kws:
-        like = f"%{k.lower()}%"
-        clauses.append("(LOWER(title) LIKE ? OR LOWER(excerpt) LIKE ? OR LOWER(content) LIKE ?)")
-        params.extend([like, like, like])
-
-    sql = f"""
-    SELECT id, date, link, title, excerpt
-    FROM bbs_posts
-    WHERE {" OR ".join(clauses)}
-    ORDER BY date DESC
-    LIMIT ?
-    """
-    params.append(int(limit))
-
-    rows = con.execute(sql, params).fetchall()
+    # Inverted-index lookup; each keyword is a quoted prefix term, ORed together.
+    match = " OR ".join('"%s"*' % k.replace('"', '""') for k in kws)
+    try:
+        rows = con.execute("""
+        SELECT b.id, b.date, b.link, b.title, b.excerpt
+        FROM bbs_posts_fts f
+        JOIN bbs_posts b ON b.id = f.rowid
+        WHERE bbs_posts_fts MATCH ?
+        ORDER BY b.date DESC
+        LIMIT ?
+        """, (match, int(limit))).fetchall()
+    except sqlite3.OperationalError:
+        # No FTS5 in this SQLite build, or an archive from before the index: scan.
+        rows = None
+    if not rows:
+        # FTS matches whole-word prefixes only ("rice" won't hit "price") and drops
+        # punctuation-only terms; when it finds nothing, fall back to the substring scan.
+        rows = _bbs_search_like(con, kws, limit)
     con.close()
 
     out = []
@@ -181,3 +303,25 @@ def bbs_search_local(
             "Excerpt": r["excerpt"],
         })
     return out
+
+
+def _bbs_search_like(con: sqlite3.Connection, kws: List[str], limit: int) -> List[sqlite3.Row]:
+    # LIKE is already ASCII case-insensitive, so no per-row LOWER(); the keyword is
+    # still lowercased in Python (full Unicode) so "É" keeps matching "é" as before.
+    # Each keyword is bound once as a numbered parameter and reused across the columns.
+    clauses = []
+    params = []
+    for i, k in enumerate(kws, start=1):
+        clauses.append(f"(title LIKE ?{i} OR excerpt LIKE ?{i} OR content LIKE ?{i})")
+        params.append(f"%{k.lower()}%")
+
+    sql = f"""
+    SELECT id, date, link, title, excerpt
+    FROM bbs_posts
+    WHERE {" OR ".join(clauses)}
+    ORDER BY date DESC
+    LIMIT ?{len(kws) + 1}
+    """
+    params.append(int(limit))
+
+    return con.execute(sql, params).fetchall()
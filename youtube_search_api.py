@@ -1,8 +1,27 @@
 from typing import List, Dict, Any
 import requests
+from requests.adapters import HTTPAdapter
 
 from core.models import Settings
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# videos.list accepts at most 50 IDs per call; extra IDs are silently dropped.
+VIDEOS_BATCH_SIZE = 50
+
+# One keep-alive session for all YouTube Data API calls (saves a TLS handshake per request).
+_YT_SESSION = requests.Session()
+_YT_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8))
+
+
+def _json(r: requests.Response) -> Dict[str, Any]:
+    return orjson.loads(r.content) if ORJSON_AVAILABLE else r.json()
+
 
 def youtube_search_videos(query: str, api_key: str, settings: Settings, max_results: int = 15) -> List[str]:
     if not api_key:
@@ -16,9 +35,9 @@ def youtube_search_videos(query: str, api_key: str, settings: Settings, max_resu
         "maxResults": int(max_results),
         "key": api_key,
     }
-    r = requests.get(url, params=params, timeout=settings.timeout_seconds)
+    r = _YT_SESSION.get(url, params=params, timeout=settings.timeout_seconds)
     r.raise_for_status()
-    data = r.json()
+    data = _json(r)
 
     ids = []
     for item in data.get("items", []) or []:
@@ -35,17 +54,19 @@ def youtube_videos_details(video_ids: List[str], api_key: str, settings: Setting
         return []
 
     url = "https://www.googleapis.com/youtube/v3/videos"
-    params = {
-        "part": "snippet,contentDetails,statistics",
-        "id": ",".join(video_ids),
-        "key": api_key,
-    }
-    r = requests.get(url, params=params, timeout=settings.timeout_seconds)
-    r.raise_for_status()
-    data = r.json()
+    items = []
+    for i in range(0, len(video_ids), VIDEOS_BATCH_SIZE):
+        params = {
+            "part": "snippet,contentDetails,statistics",
+            "id": ",".join(video_ids[i:i + VIDEOS_BATCH_SIZE]),
+            "key": api_key,
+        }
+        r = _YT_SESSION.get(url, params=params, timeout=settings.timeout_seconds)
+        r.raise_for_status()
+        items.extend(_json(r).get("items", []) or [])
 
     out = []
-    for it in data.get("items", []) or []:
+    for it in items:
         sn = it.get("snippet", {}) or {}
         st = it.get("statistics", {}) or {}
         cd = it.get("contentDetails", {}) or {}